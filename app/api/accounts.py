@@ -5,74 +5,118 @@ Provides CRUD operations for user and AI agent accounts.
 from typing import List
 from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi.responses import ORJSONResponse
+from fastapi_cache.decorator import cache
+from sqlalchemy import bindparam, literal, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
+from pydantic import TypeAdapter
 
+from app.api.streaming import STREAM_THRESHOLD, stream_json_list
+from app.core.cache import cache_key, get_flag, invalidate, path_param_key_builder, set_flag
 from app.core.database import get_db
 from app.models.account import Account
 from app.schemas.account import AccountCreate, AccountUpdate, AccountResponse
+from app.schemas.base import construct_from_orm
 
 router = APIRouter(prefix="/accounts", tags=["Accounts"])
 
+# Pre-built statements, reused across requests so they hit the compiled statement cache
+SELECT_ACCOUNT_BY_ID = select(Account).where(Account.id == bindparam("aid"))
+SELECT_ACCOUNT_EXISTS = select(literal(1)).where(Account.id == bindparam("aid")).limit(1)
+
+ACCOUNT_LIST_ADAPTER = TypeAdapter(List[AccountResponse])
+
+# How long a positive account existence check is remembered in Redis (seconds)
+ACCOUNT_EXISTS_TTL = 60
+
+
+async def ensure_account_exists(account_id: UUID, db: AsyncSession):
+    """
+    Raise 404 unless the account exists.
+    Used by endpoints that only need the account as a guard, so it selects a
+    constant instead of the full row and remembers hits in Redis briefly.
+    """
+    key = cache_key("acct_exists", account_id)
+    if await get_flag(key):
+        return
+    if not (await db.execute(SELECT_ACCOUNT_EXISTS, {"aid": account_id})).scalar():
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Account with ID {account_id} not found"
+        )
+    await set_flag(key, ACCOUNT_EXISTS_TTL)
+
 
 @router.post("/", response_model=AccountResponse, status_code=status.HTTP_201_CREATED)
-def create_account(account_data: AccountCreate, db: Session = Depends(get_db)):
+async def create_account(account_data: AccountCreate, db: AsyncSession = Depends(get_db)):
     """
     Create a new account (user or AI agent).
     
     2026 Feature: Agentic Commerce
     - Set is_agent=true to create an AI agent account
     """
-    try:
-        new_account = Account(
+    # INSERT ... ON CONFLICT DO NOTHING RETURNING: a duplicate email (exact or
+    # case-insensitive) returns no row instead of failing and rolling back
+    new_account = (await db.execute(
+        pg_insert(Account).values(
             name=account_data.name,
             email=account_data.email,
             balance=account_data.initial_balance,
             is_agent=account_data.is_agent
-        )
-        db.add(new_account)
-        db.commit()
-        db.refresh(new_account)
-        return new_account
-    except IntegrityError:
-        db.rollback()
+        ).on_conflict_do_nothing().returning(Account)
+    )).scalar_one_or_none()
+    if new_account is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Account with this email already exists"
         )
+    
+    await db.commit()
+    return new_account
 
 
 @router.get("/{account_id}", response_model=AccountResponse)
-def get_account(account_id: UUID, db: Session = Depends(get_db)):
+@cache(expire=30, namespace="account", key_builder=path_param_key_builder("account_id"))
+async def get_account(account_id: UUID, db: AsyncSession = Depends(get_db)):
     """
     Retrieve an account by ID.
     Returns account details including current balance.
     """
-    account = db.query(Account).filter(Account.id == account_id).first()
+    account = (await db.execute(SELECT_ACCOUNT_BY_ID, {"aid": account_id})).scalar_one_or_none()
     if not account:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Account with ID {account_id} not found"
         )
-    return account
+    return AccountResponse.model_validate(account)
 
 
 @router.get("/", response_model=List[AccountResponse])
-def list_accounts(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
+async def list_accounts(skip: int = 0, limit: int = 100, db: AsyncSession = Depends(get_db)):
     """
     List all accounts with pagination.
+    Pages larger than 100 rows are streamed from a server-side cursor.
     """
-    accounts = db.query(Account).offset(skip).limit(limit).all()
-    return accounts
+    query = select(Account).offset(skip).limit(limit)
+    if limit > STREAM_THRESHOLD:
+        return stream_json_list(query, AccountResponse)
+    
+    accounts = (await db.execute(query)).scalars().all()
+    # Rows are trusted: build responses without re-validation and bypass FastAPI's response_model pass
+    return ORJSONResponse(content=ACCOUNT_LIST_ADAPTER.dump_python(
+        [construct_from_orm(AccountResponse, account) for account in accounts], mode="json"
+    ))
 
 
 @router.patch("/{account_id}", response_model=AccountResponse)
-def update_account(account_id: UUID, account_data: AccountUpdate, db: Session = Depends(get_db)):
+async def update_account(account_id: UUID, account_data: AccountUpdate, db: AsyncSession = Depends(get_db)):
     """
     Update account details (name or email).
     Note: Balance cannot be updated directly - use transactions instead.
     """
-    account = db.query(Account).filter(Account.id == account_id).first()
+    account = (await db.execute(SELECT_ACCOUNT_BY_ID, {"aid": account_id})).scalar_one_or_none()
     if not account:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -85,11 +129,11 @@ def update_account(account_id: UUID, account_data: AccountUpdate, db: Session =
         if account_data.email is not None:
             account.email = account_data.email
         
-        db.commit()
-        db.refresh(account)
+        await db.commit()
+        await invalidate(cache_key("account", account_id))
         return account
     except IntegrityError:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email already exists"
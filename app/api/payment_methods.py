@@ -5,19 +5,32 @@ Provides operations for managing tokenized payment methods.
 from typing import List
 from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi_cache.decorator import cache
+from sqlalchemy import bindparam, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
 
+from app.api.accounts import ensure_account_exists
+from app.core.cache import cache_key, invalidate, path_param_key_builder
 from app.core.database import get_db
-from app.models.account import Account
 from app.models.payment_method import PaymentMethod
 from app.schemas.payment_method import PaymentMethodCreate, PaymentMethodResponse
 
 router = APIRouter(prefix="/methods", tags=["Payment Methods"])
 
+# Pre-built statements, reused across requests so they hit the compiled statement cache
+SELECT_PAYMENT_METHOD_BY_ID = select(PaymentMethod).where(PaymentMethod.id == bindparam("mid"))
+SELECT_PAYMENT_METHODS_BY_ACCOUNT = select(PaymentMethod).where(
+    PaymentMethod.account_id == bindparam("aid"),
+    PaymentMethod.is_active == True  # noqa: E712  (matches the ix_pm_account_active partial index)
+)
+
+# Postgres SQLSTATE for a foreign_key_violation (account_id references no account)
+FOREIGN_KEY_VIOLATION = "23503"
+
 
 @router.post("/", response_model=PaymentMethodResponse, status_code=status.HTTP_201_CREATED)
-def create_payment_method(method_data: PaymentMethodCreate, db: Session = Depends(get_db)):
+async def create_payment_method(method_data: PaymentMethodCreate, db: AsyncSession = Depends(get_db)):
     """
     Add a new tokenized payment method.
     
@@ -25,14 +38,7 @@ def create_payment_method(method_data: PaymentMethodCreate, db: Session = Depend
     - Store token_id instead of raw card numbers
     - Supports various method types (Apple Pay, Stablecoin, etc.)
     """
-    # Validate account exists
-    account = db.query(Account).filter(Account.id == method_data.account_id).first()
-    if not account:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Account with ID {method_data.account_id} not found"
-        )
-    
+    # The account_id foreign key validates the account; no separate lookup needed
     try:
         new_method = PaymentMethod(
             account_id=method_data.account_id,
@@ -40,11 +46,16 @@ def create_payment_method(method_data: PaymentMethodCreate, db: Session = Depend
             token_id=method_data.token_id
         )
         db.add(new_method)
-        db.commit()
-        db.refresh(new_method)
+        await db.commit()
+        await invalidate(cache_key("account_payment_methods", method_data.account_id))
         return new_method
-    except IntegrityError:
-        db.rollback()
+    except IntegrityError as e:
+        await db.rollback()
+        if getattr(e.orig, "sqlstate", None) == FOREIGN_KEY_VIOLATION:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Account with ID {method_data.account_id} not found"
+            )
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Payment method with this token_id already exists"
@@ -52,31 +63,32 @@ def create_payment_method(method_data: PaymentMethodCreate, db: Session = Depend
 
 
 @router.get("/{method_id}", response_model=PaymentMethodResponse)
-def get_payment_method(method_id: UUID, db: Session = Depends(get_db)):
+@cache(expire=3600, namespace="payment_method", key_builder=path_param_key_builder("method_id"))
+async def get_payment_method(method_id: UUID, db: AsyncSession = Depends(get_db)):
     """
     Retrieve a payment method by ID.
     """
-    method = db.query(PaymentMethod).filter(PaymentMethod.id == method_id).first()
+    method = (await db.execute(
+        SELECT_PAYMENT_METHOD_BY_ID, {"mid": method_id}
+    )).scalar_one_or_none()
     if not method:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Payment method with ID {method_id} not found"
         )
-    return method
+    return PaymentMethodResponse.model_validate(method)
 
 
 @router.get("/account/{account_id}", response_model=List[PaymentMethodResponse])
-def list_account_payment_methods(account_id: UUID, db: Session = Depends(get_db)):
+@cache(expire=300, namespace="account_payment_methods", key_builder=path_param_key_builder("account_id"))
+async def list_account_payment_methods(account_id: UUID, db: AsyncSession = Depends(get_db)):
     """
-    List all payment methods for a specific account.
+    List all active payment methods for a specific account.
     """
     # Validate account exists
-    account = db.query(Account).filter(Account.id == account_id).first()
-    if not account:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Account with ID {account_id} not found"
-        )
+    await ensure_account_exists(account_id, db)
     
-    methods = db.query(PaymentMethod).filter(PaymentMethod.account_id == account_id).all()
-    return methods
+    methods = (await db.execute(
+        SELECT_PAYMENT_METHODS_BY_ACCOUNT, {"aid": account_id}
+    )).scalars().all()
+    return [PaymentMethodResponse.model_validate(method) for method in methods]
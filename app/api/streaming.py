@@ -0,0 +1,40 @@
+"""
+Streaming helpers for large list endpoints.
+Serializes rows batch by batch from a server-side cursor instead of loading the whole result.
+"""
+from typing import Type
+
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from sqlalchemy.sql import Select
+
+from app.core.database import AsyncSessionLocal
+from app.schemas.base import construct_from_orm
+
+# Pages up to this size are loaded with .all(); larger ones are streamed
+STREAM_THRESHOLD = 100
+
+# Rows fetched from the server-side cursor per round trip
+STREAM_BATCH_SIZE = 200
+
+
+def stream_json_list(statement: Select, schema: Type[BaseModel]) -> StreamingResponse:
+    """
+    Stream the rows of `statement` as a JSON array of `schema` objects.
+    
+    The generator opens its own session: FastAPI closes request-scoped
+    dependencies before a StreamingResponse body is sent, so the request's
+    session cannot back the cursor. Peak memory is one batch, not the whole page.
+    """
+    async def generate():
+        async with AsyncSessionLocal() as db:
+            result = await db.stream(statement.execution_options(yield_per=STREAM_BATCH_SIZE))
+            yield b"["
+            first = True
+            async for rows in result.scalars().partitions():
+                chunk = b",".join(construct_from_orm(schema, row).model_dump_json().encode() for row in rows)
+                yield chunk if first else b"," + chunk
+                first = False
+            yield b"]"
+    
+    return StreamingResponse(generate(), media_type="application/json")
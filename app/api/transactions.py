@@ -2,37 +2,82 @@
 Transaction API endpoints.
 Provides operations for creating and tracking money transfers with ACID guarantees.
 """
-from datetime import datetime
-from typing import List
+from datetime import datetime, timezone
+from typing import List, Optional
 from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi.responses import ORJSONResponse
+from fastapi_cache.decorator import cache
+from sqlalchemy import bindparam, insert, select, text, tuple_, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased, raiseload
 from sqlalchemy.exc import SQLAlchemyError
+from pydantic import TypeAdapter
 
-from app.core.database import get_db
+from app.api.accounts import ensure_account_exists
+from app.core.config import settings
+from app.api.streaming import STREAM_THRESHOLD, stream_json_list
+from app.core.cache import cache_key, invalidate, path_param_key_builder
+from app.core.database import get_db, utcnow
 from app.models.account import Account
 from app.models.transaction import Transaction
+from app.schemas.base import construct_from_orm
 from app.schemas.transaction import TransactionCreate, TransactionResponse
 
 router = APIRouter(prefix="/transactions", tags=["Transactions"])
 
+# Pre-built statements, reused across requests so they hit the compiled statement cache
+SELECT_TRANSACTION_BY_ID = select(Transaction).where(Transaction.id == bindparam("tid"))
+SELECT_ACCOUNT_BALANCE = select(Account.balance).where(Account.id == bindparam("aid"))
+TRANSFER = text("SELECT transfer(:from_id, :to_id, :amount, :description)")
+
+# SQLSTATE raised by transfer() when either account does not exist
+ACCOUNT_NOT_FOUND_SQLSTATE = "P0002"
+
+TRANSACTION_LIST_ADAPTER = TypeAdapter(List[TransactionResponse])
+
+# TransactionResponse only exposes account IDs, so no relationships are loaded.
+# Outside prod, any relationship traversal raises instead of silently querying (N+1);
+# add an explicit selectinload here once a response schema needs account data.
+TRANSACTION_LOAD_OPTIONS = []
+if settings.env != "prod":
+    TRANSACTION_LOAD_OPTIONS.append(raiseload("*"))
+
+
+async def _record_failed_transaction(db: AsyncSession, transaction_data: TransactionCreate):
+    """
+    Log a "Failed" transaction row for an attempted transfer.
+    Uses a plain INSERT: the caller only returns an error, so there is no need
+    to materialize or refresh an ORM object.
+    """
+    await db.execute(
+        insert(Transaction).values(
+            from_account_id=transaction_data.from_account_id,
+            to_account_id=transaction_data.to_account_id,
+            amount=transaction_data.amount,
+            description=transaction_data.description,
+            status="Failed",
+            completed_at=utcnow()
+        )
+    )
+    await db.commit()
+
 
 @router.post("/", response_model=TransactionResponse, status_code=status.HTTP_201_CREATED)
-def create_transaction(transaction_data: TransactionCreate, db: Session = Depends(get_db)):
+async def create_transaction(transaction_data: TransactionCreate, db: AsyncSession = Depends(get_db)):
     """
     Execute a money transfer between accounts with ACID transaction guarantees.
     
     2026 Feature: Instant Payments with status tracking
     
-    ACID Transaction Flow:
-    1. Begin database transaction
-    2. Lock source account (SELECT FOR UPDATE)
-    3. Validate sufficient balance
-    4. Deduct from source account
-    5. Credit destination account
-    6. Create transaction record with status="Completed"
-    7. Commit all changes atomically
-    8. On any failure: rollback entire transaction, set status="Failed"
+    ACID Transaction Flow (inside the Postgres transfer() function, one round trip):
+    1. Lock source and destination accounts (SELECT FOR UPDATE, ordered by id)
+    2. Validate both accounts exist and the balance is sufficient
+    3. Deduct from source account and credit destination account
+    4. Create transaction record with status="Completed"
+    5. On insufficient balance: record the transaction with status="Failed" instead
+    6. Commit all changes atomically
+    7. On any failure: rollback entire transaction, set status="Failed"
     """
     # Validate source and destination are different
     if transaction_data.from_account_id == transaction_data.to_account_id:
@@ -42,91 +87,32 @@ def create_transaction(transaction_data: TransactionCreate, db: Session = Depend
         )
     
     try:
-        # Begin transaction (automatic with SQLAlchemy session)
-        # Step 1: Lock source account row to prevent race conditions
-        from_account = db.query(Account).filter(
-            Account.id == transaction_data.from_account_id
-        ).with_for_update().first()
-        
-        if not from_account:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Source account {transaction_data.from_account_id} not found"
-            )
-        
-        # Step 2: Validate destination account exists
-        to_account = db.query(Account).filter(
-            Account.id == transaction_data.to_account_id
-        ).with_for_update().first()
+        transaction_id = (await db.execute(TRANSFER, {
+            "from_id": transaction_data.from_account_id,
+            "to_id": transaction_data.to_account_id,
+            "amount": transaction_data.amount,
+            "description": transaction_data.description,
+        })).scalar_one()
+        await db.commit()
+    except SQLAlchemyError as e:
+        # Database error - rollback transaction
+        await db.rollback()
         
-        if not to_account:
+        # transfer() signals a missing account with a dedicated SQLSTATE
+        if getattr(getattr(e, "orig", None), "sqlstate", None) == ACCOUNT_NOT_FOUND_SQLSTATE:
+            if "SOURCE_ACCOUNT_NOT_FOUND" in str(e.orig):
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"Source account {transaction_data.from_account_id} not found"
+                )
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Destination account {transaction_data.to_account_id} not found"
             )
         
-        # Step 3: Check sufficient balance
-        if from_account.balance < transaction_data.amount:
-            # Create failed transaction record
-            failed_transaction = Transaction(
-                from_account_id=transaction_data.from_account_id,
-                to_account_id=transaction_data.to_account_id,
-                amount=transaction_data.amount,
-                description=transaction_data.description,
-                status="Failed",
-                completed_at=datetime.utcnow()
-            )
-            db.add(failed_transaction)
-            db.commit()
-            db.refresh(failed_transaction)
-            
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Insufficient balance. Available: {from_account.balance}, Required: {transaction_data.amount}"
-            )
-        
-        # Step 4: Deduct from source account
-        from_account.balance -= transaction_data.amount
-        
-        # Step 5: Credit destination account
-        to_account.balance += transaction_data.amount
-        
-        # Step 6: Create transaction record with "Completed" status
-        new_transaction = Transaction(
-            from_account_id=transaction_data.from_account_id,
-            to_account_id=transaction_data.to_account_id,
-            amount=transaction_data.amount,
-            description=transaction_data.description,
-            status="Completed",
-            completed_at=datetime.utcnow()
-        )
-        db.add(new_transaction)
-        
-        # Step 7: Commit all changes atomically
-        db.commit()
-        db.refresh(new_transaction)
-        
-        return new_transaction
-        
-    except HTTPException:
-        # Re-raise HTTP exceptions (validation errors)
-        raise
-    except SQLAlchemyError as e:
-        # Database error - rollback transaction
-        db.rollback()
-        
         # Try to create failed transaction record
         try:
-            failed_transaction = Transaction(
-                from_account_id=transaction_data.from_account_id,
-                to_account_id=transaction_data.to_account_id,
-                amount=transaction_data.amount,
-                description=transaction_data.description,
-                status="Failed",
-                completed_at=datetime.utcnow()
-            )
-            db.add(failed_transaction)
-            db.commit()
+            await _record_failed_transaction(db, transaction_data)
         except:
             pass  # If we can't log the failure, continue with error response
         
@@ -134,37 +120,111 @@ def create_transaction(transaction_data: TransactionCreate, db: Session = Depend
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Transaction failed due to database error: {str(e)}"
         )
+    
+    new_transaction = (await db.execute(
+        SELECT_TRANSACTION_BY_ID, {"tid": transaction_id}
+    )).scalar_one()
+    
+    if new_transaction.status == "Failed":
+        # Only the (rare) failure path pays for this extra read
+        available = (await db.execute(
+            SELECT_ACCOUNT_BALANCE, {"aid": transaction_data.from_account_id}
+        )).scalar_one()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Insufficient balance. Available: {available}, Required: {transaction_data.amount}"
+        )
+    
+    # Drop cached balances for both accounts now that the transfer is committed
+    await invalidate(
+        cache_key("account", transaction_data.from_account_id),
+        cache_key("account", transaction_data.to_account_id)
+    )
+    
+    return new_transaction
 
 
 @router.get("/{transaction_id}", response_model=TransactionResponse)
-def get_transaction(transaction_id: UUID, db: Session = Depends(get_db)):
+@cache(expire=86400, namespace="transaction", key_builder=path_param_key_builder("transaction_id"))
+async def get_transaction(transaction_id: UUID, db: AsyncSession = Depends(get_db)):
     """
     Retrieve transaction details by ID.
     """
-    transaction = db.query(Transaction).filter(Transaction.id == transaction_id).first()
+    transaction = (await db.execute(
+        SELECT_TRANSACTION_BY_ID, {"tid": transaction_id}
+    )).scalar_one_or_none()
     if not transaction:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Transaction with ID {transaction_id} not found"
         )
-    return transaction
+    return TransactionResponse.model_validate(transaction)
+
+
+def _account_history_query(account_id: UUID, after: Optional[datetime], after_id: Optional[UUID], limit: int):
+    """
+    Build the newest-first history page for an account as a UNION ALL of the sent
+    and received sides.
+    
+    An OR across from_account_id/to_account_id forces Postgres to BitmapOr both
+    indexes, fetch every row for the account and sort it. Each branch here instead
+    reads ix_tx_from_created / ix_tx_to_created backwards and stops after `limit`
+    rows; the outer query merges at most 2 * limit rows. Self-transfers are
+    rejected, so the branches never return the same row.
+    """
+    def branch(account_column):
+        query = select(Transaction).where(account_column == account_id)
+        if after is not None:
+            # (created_at, id) is unique, so rows sharing the boundary timestamp are not skipped
+            query = query.where(tuple_(Transaction.created_at, Transaction.id) < tuple_(after, after_id))
+        return query.order_by(Transaction.created_at.desc(), Transaction.id.desc()).limit(limit)
+    
+    history = aliased(
+        Transaction,
+        union_all(branch(Transaction.from_account_id), branch(Transaction.to_account_id)).subquery("history")
+    )
+    return (
+        select(history)
+        .options(*TRANSACTION_LOAD_OPTIONS)
+        .order_by(history.created_at.desc(), history.id.desc())
+        .limit(limit)
+    )
 
 
 @router.get("/account/{account_id}", response_model=List[TransactionResponse])
-def list_account_transactions(account_id: UUID, skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
+async def list_account_transactions(
+    account_id: UUID,
+    after: Optional[datetime] = None,
+    after_id: Optional[UUID] = None,
+    limit: int = 100,
+    db: AsyncSession = Depends(get_db)
+):
     """
-    List all transactions for a specific account (sent or received).
+    List all transactions for a specific account (sent or received), newest first.
+    
+    Uses keyset pagination: pass the created_at and id of the last transaction on
+    the previous page as `after` and `after_id` to fetch the next page. Pages
+    larger than 100 rows are streamed from a server-side cursor.
     """
-    # Validate account exists
-    account = db.query(Account).filter(Account.id == account_id).first()
-    if not account:
+    if (after is None) != (after_id is None):
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Account with ID {account_id} not found"
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="after and after_id must be provided together"
         )
+    if after is not None and after.tzinfo is not None:
+        # created_at is stored as naive UTC
+        after = after.astimezone(timezone.utc).replace(tzinfo=None)
+    
+    # Validate account exists
+    await ensure_account_exists(account_id, db)
+    
+    query = _account_history_query(account_id, after, after_id, limit)
+    if limit > STREAM_THRESHOLD:
+        return stream_json_list(query, TransactionResponse)
     
-    transactions = db.query(Transaction).filter(
-        (Transaction.from_account_id == account_id) | (Transaction.to_account_id == account_id)
-    ).offset(skip).limit(limit).all()
+    transactions = (await db.execute(query)).scalars().all()
     
-    return transactions
+    # Rows are trusted: build responses without re-validation and bypass FastAPI's response_model pass
+    return ORJSONResponse(content=TRANSACTION_LIST_ADAPTER.dump_python(
+        [construct_from_orm(TransactionResponse, transaction) for transaction in transactions], mode="json"
+    ))
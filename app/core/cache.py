@@ -0,0 +1,79 @@
+"""
+Redis-backed response cache for read endpoints.
+Provides cache initialization, per-resource key builders, and explicit invalidation helpers.
+
+Cache failures never fail a request: reads fall back to PostgreSQL and errors are logged,
+matching how the @cache decorator treats backend errors.
+"""
+import logging
+
+from fastapi_cache import FastAPICache
+from fastapi_cache.backends.redis import RedisBackend
+from redis import asyncio as aioredis
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+CACHE_PREFIX = "pay"
+
+
+def init_cache():
+    """
+    Initialize FastAPICache with a Redis backend.
+    Called once from the application startup handler.
+    """
+    redis = aioredis.from_url(settings.redis_url)
+    FastAPICache.init(RedisBackend(redis), prefix=CACHE_PREFIX)
+
+
+def cache_key(namespace: str, identifier) -> str:
+    """
+    Build the full Redis key for a cached resource, e.g. "pay:account:<uuid>".
+    Shared by the @cache key builder and invalidate() so both address the same entry.
+    """
+    return f"{FastAPICache.get_prefix()}:{namespace}:{identifier}"
+
+
+def path_param_key_builder(param: str):
+    """
+    Key builder that scopes cache entries by a single path parameter.
+    
+    The default fastapi-cache key builder hashes every argument, including the
+    database session, so it would never produce a hit. Keying on the resource
+    ID also lets write endpoints invalidate exactly the entries they touch.
+    """
+    def key_builder(func, namespace: str = "", request=None, response=None, args=(), kwargs=None):
+        # fastapi-cache passes the bare decorator namespace here, without the global prefix
+        return cache_key(namespace, kwargs[param])
+    return key_builder
+
+
+async def get_flag(key: str) -> bool:
+    """Return True if a short-lived marker key is present in Redis (False if Redis is unavailable)."""
+    try:
+        return await FastAPICache.get_backend().get(key) is not None
+    except Exception:
+        logger.warning("Error reading cache key %s", key, exc_info=True)
+        return False
+
+
+async def set_flag(key: str, expire: int):
+    """Store a short-lived marker key (SETEX key expire 1)."""
+    try:
+        await FastAPICache.get_backend().set(key, "1", expire)
+    except Exception:
+        logger.warning("Error setting cache key %s", key, exc_info=True)
+
+
+async def invalidate(*keys: str):
+    """
+    Delete cached responses so subsequent reads go back to PostgreSQL.
+    Called after a commit, so a Redis error is logged rather than raised: the
+    write has already happened and a 500 would invite the client to repeat it.
+    """
+    for key in keys:
+        try:
+            await FastAPICache.get_backend().clear(key=key)
+        except Exception:
+            logger.warning("Error invalidating cache key %s", key, exc_info=True)
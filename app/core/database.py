@@ -1,39 +1,53 @@
 """
-Database connection and session management using SQLAlchemy.
-Provides database engine, session factory, and dependency injection for FastAPI routes.
+Database connection and session management using SQLAlchemy (asyncio).
+Provides async database engine, session factory, and dependency injection for FastAPI routes.
 """
-from sqlalchemy import create_engine
+from sqlalchemy import func
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
 
 from app.core.config import settings
 
-# Create SQLAlchemy engine
-engine = create_engine(
-    settings.database_url,
+# Async driver URL (also used by Alembic migrations)
+ASYNC_DATABASE_URL = settings.database_url.replace("postgresql://", "postgresql+asyncpg://")
+
+# Create async SQLAlchemy engine (asyncpg driver)
+engine = create_async_engine(
+    ASYNC_DATABASE_URL,
     pool_pre_ping=True,  # Verify connections before using
+    pool_size=settings.pool_size,
+    max_overflow=settings.max_overflow,
+    pool_recycle=settings.pool_recycle,  # Recycle connections to avoid stale TCP sessions
+    pool_timeout=settings.pool_timeout,  # Fail fast instead of stalling workers
+    query_cache_size=1200,  # Compiled statement cache (SQLAlchemy default is 500)
     echo=False  # Set to True for SQL query logging during development
 )
 
 # Session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+AsyncSessionLocal = async_sessionmaker(engine, autoflush=False, expire_on_commit=False)
 
 # Base class for all models
 Base = declarative_base()
 
 
-def get_db():
+def utcnow():
+    """
+    Server-side UTC timestamp expression for column defaults and inserts.
+    Evaluated by Postgres (transaction start time), so timestamps are consistent
+    with the commit instead of being computed in Python and shipped as parameters.
+    """
+    return func.timezone("utc", func.now())
+
+
+async def get_db():
     """
     Dependency function for FastAPI routes.
-    Yields a database session and ensures it's closed after use.
+    Yields an async database session and ensures it's closed after use.
     
     Usage:
         @app.get("/endpoint")
-        def endpoint(db: Session = Depends(get_db)):
+        async def endpoint(db: AsyncSession = Depends(get_db)):
             ...
     """
-    db = SessionLocal()
-    try:
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
@@ -7,22 +7,26 @@ Main application entry point.
 - Network Tokenization: Storing tokens instead of raw card numbers
 - Instant Payments: Real-time transaction status tracking
 """
+import importlib.util
+from pathlib import Path
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
+from app.core.cache import init_cache
+from app.core.config import settings
 from app.core.database import engine, Base
 from app.api import accounts_router, payment_methods_router, transactions_router
 
-# Create database tables
-Base.metadata.create_all(bind=engine)
-
 # Initialize FastAPI application
 app = FastAPI(
     title="Payment REST Service",
     description="Modern payment API supporting Agentic Commerce and Network Tokenization",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse  # C-level JSON encoding for all responses
 )
 
 # Configure CORS for frontend integration
@@ -57,14 +61,35 @@ def health_check():
     }
 
 
+# transfer() is not ORM metadata, so the dev-only create_all path reuses the SQL of the
+# latest migration that defines it instead of keeping a second copy in application code
+TRANSFER_FUNCTION_MIGRATION = (
+    Path(__file__).resolve().parent.parent / "migrations" / "versions" / "0007_drop_account_version.py"
+)
+
+
+def load_transfer_function_sql() -> str:
+    spec = importlib.util.spec_from_file_location("transfer_function_migration", TRANSFER_FUNCTION_MIGRATION)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.TRANSFER_FUNCTION_SQL
+
+
 @app.on_event("startup")
 async def startup_event():
     """
     Startup event handler.
-    Database tables are created automatically via Base.metadata.create_all()
+    Database schema is managed by Alembic (`alembic upgrade head`).
+    Set AUTO_CREATE_TABLES=true to create missing tables on startup in development.
     """
-    print("🚀 Payment REST Service starting...")
-    print("📊 Database tables created/verified")
+    if settings.auto_create_tables:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+            await conn.exec_driver_sql(load_transfer_function_sql())
+        print("📊 Database tables created/verified")
+    init_cache()
+    print("🚀 Payment REST Service ready")
+    print("⚡ Redis response cache initialized")
     print("🔗 API documentation available at: http://localhost:8000/docs")
 
 
@@ -3,12 +3,11 @@ Account SQLAlchemy model.
 Supports both regular users and AI agents (Agentic Commerce).
 """
 import uuid
-from datetime import datetime
-from sqlalchemy import Column, String, Numeric, Boolean, DateTime
+from sqlalchemy import Column, String, Numeric, Boolean, DateTime, Index, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
-from app.core.database import Base
+from app.core.database import Base, utcnow
 
 
 class Account(Base):
@@ -19,14 +18,20 @@ class Account(Base):
     - is_agent field identifies AI agents that make autonomous purchases
     """
     __tablename__ = "accounts"
+    __mapper_args__ = {"eager_defaults": True}  # Fetch server-generated columns via RETURNING
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
     name = Column(String(255), nullable=False)
     email = Column(String(255), unique=True, nullable=False, index=True)
     balance = Column(Numeric(precision=12, scale=2), nullable=False, default=0.00)
     is_agent = Column(Boolean, default=False, nullable=False)  # Agentic Commerce flag
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=utcnow(), nullable=False)
+    updated_at = Column(DateTime, server_default=utcnow(), onupdate=utcnow(), nullable=False)
+    
+    __table_args__ = (
+        # Case-insensitive uniqueness; serves func.lower(Account.email) == email.lower() lookups
+        Index("ix_accounts_email_lower", func.lower(email), unique=True),
+    )
     
     # Relationships
     payment_methods = relationship("PaymentMethod", back_populates="account", cascade="all, delete-orphan")
@@ -3,12 +3,11 @@ Payment Method SQLAlchemy model.
 Stores tokenized payment methods (Network Tokenization).
 """
 import uuid
-from datetime import datetime
-from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey
+from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
-from app.core.database import Base
+from app.core.database import Base, utcnow
 
 
 class PaymentMethod(Base):
@@ -20,13 +19,20 @@ class PaymentMethod(Base):
     - method_type supports various payment types (Apple Pay, Stablecoin, etc.)
     """
     __tablename__ = "payment_methods"
+    __mapper_args__ = {"eager_defaults": True}  # Fetch server-generated columns via RETURNING
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
     account_id = Column(UUID(as_uuid=True), ForeignKey("accounts.id"), nullable=False, index=True)
     method_type = Column(String(100), nullable=False)  # e.g., "Apple Pay", "Stablecoin", "Card Token"
     token_id = Column(String(255), unique=True, nullable=False, index=True)  # Network token
     is_active = Column(Boolean, default=True, nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=utcnow(), nullable=False)
+    
+    __table_args__ = (
+        # Partial indexes over live tokens only: smaller, and hot in cache for active lookups
+        Index("ix_pm_token_active", token_id, postgresql_where=is_active),
+        Index("ix_pm_account_active", account_id, postgresql_where=is_active),
+    )
     
     # Relationships
     account = relationship("Account", back_populates="payment_methods")
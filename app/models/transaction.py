@@ -3,12 +3,11 @@ Transaction SQLAlchemy model.
 Tracks money movements between accounts with status support for Instant Payments.
 """
 import uuid
-from datetime import datetime
-from sqlalchemy import Column, String, Numeric, DateTime, ForeignKey
+from sqlalchemy import Column, String, Numeric, DateTime, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
-from app.core.database import Base
+from app.core.database import Base, utcnow
 
 
 class Transaction(Base):
@@ -20,14 +19,22 @@ class Transaction(Base):
     - Status values: "Pending", "Completed", "Failed"
     """
     __tablename__ = "transactions"
+    __mapper_args__ = {"eager_defaults": True}  # Fetch server-generated columns via RETURNING
+    __table_args__ = (
+        # Per-direction history indexes: each branch of the account-history UNION ALL
+        # reads one of these backwards in (created_at, id) order and stops at the page
+        # limit (also covers account_id lookups)
+        Index("ix_tx_from_created", "from_account_id", "created_at", "id"),
+        Index("ix_tx_to_created", "to_account_id", "created_at", "id"),
+    )
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
-    from_account_id = Column(UUID(as_uuid=True), ForeignKey("accounts.id"), nullable=False, index=True)
-    to_account_id = Column(UUID(as_uuid=True), ForeignKey("accounts.id"), nullable=False, index=True)
+    from_account_id = Column(UUID(as_uuid=True), ForeignKey("accounts.id"), nullable=False)
+    to_account_id = Column(UUID(as_uuid=True), ForeignKey("accounts.id"), nullable=False)
     amount = Column(Numeric(precision=12, scale=2), nullable=False)
     status = Column(String(20), nullable=False, default="Pending")  # Pending, Completed, Failed
     description = Column(String(500), nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=utcnow(), nullable=False)
     completed_at = Column(DateTime, nullable=True)
     
     # Relationships
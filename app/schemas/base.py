@@ -0,0 +1,17 @@
+"""
+Shared helpers for Pydantic response schemas.
+"""
+from typing import Type, TypeVar
+
+from pydantic import BaseModel
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+def construct_from_orm(model_cls: Type[ModelT], obj) -> ModelT:
+    """
+    Build a response model from a trusted ORM row without re-running validation.
+    Rows were validated on the way in, so list endpoints skip per-row
+    EmailStr/Decimal checks by copying attributes straight into the model.
+    """
+    return model_cls.model_construct(**{name: getattr(obj, name) for name in model_cls.model_fields})
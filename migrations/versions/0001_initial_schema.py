@@ -0,0 +1,86 @@
+"""Initial schema: accounts, payment_methods, transactions
+
+Matches the tables the original create_all() produced, so existing databases
+can be adopted with `alembic stamp 0001`.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-15 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "0001"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "accounts",
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("name", sa.String(length=255), nullable=False),
+        sa.Column("email", sa.String(length=255), nullable=False),
+        sa.Column("balance", sa.Numeric(precision=12, scale=2), nullable=False),
+        sa.Column("is_agent", sa.Boolean(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_accounts_id", "accounts", ["id"])
+    op.create_index("ix_accounts_email", "accounts", ["email"], unique=True)
+
+    op.create_table(
+        "payment_methods",
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("account_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("method_type", sa.String(length=100), nullable=False),
+        sa.Column("token_id", sa.String(length=255), nullable=False),
+        sa.Column("is_active", sa.Boolean(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["account_id"], ["accounts.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_payment_methods_id", "payment_methods", ["id"])
+    op.create_index("ix_payment_methods_account_id", "payment_methods", ["account_id"])
+    op.create_index("ix_payment_methods_token_id", "payment_methods", ["token_id"], unique=True)
+
+    op.create_table(
+        "transactions",
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("from_account_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("to_account_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("amount", sa.Numeric(precision=12, scale=2), nullable=False),
+        sa.Column("status", sa.String(length=20), nullable=False),
+        sa.Column("description", sa.String(length=500), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("completed_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["from_account_id"], ["accounts.id"]),
+        sa.ForeignKeyConstraint(["to_account_id"], ["accounts.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_transactions_id", "transactions", ["id"])
+    op.create_index("ix_transactions_from_account_id", "transactions", ["from_account_id"])
+    op.create_index("ix_transactions_to_account_id", "transactions", ["to_account_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_transactions_to_account_id", table_name="transactions")
+    op.drop_index("ix_transactions_from_account_id", table_name="transactions")
+    op.drop_index("ix_transactions_id", table_name="transactions")
+    op.drop_table("transactions")
+
+    op.drop_index("ix_payment_methods_token_id", table_name="payment_methods")
+    op.drop_index("ix_payment_methods_account_id", table_name="payment_methods")
+    op.drop_index("ix_payment_methods_id", table_name="payment_methods")
+    op.drop_table("payment_methods")
+
+    op.drop_index("ix_accounts_email", table_name="accounts")
+    op.drop_index("ix_accounts_id", table_name="accounts")
+    op.drop_table("accounts")
@@ -0,0 +1,31 @@
+"""Per-direction (account, created_at, id) indexes for transaction history
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-15 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0003"
+down_revision: Union[str, None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_tx_from_created", "transactions", ["from_account_id", "created_at", "id"])
+    op.create_index("ix_tx_to_created", "transactions", ["to_account_id", "created_at", "id"])
+    # The single-column account indexes are prefixes of the new ones
+    op.drop_index("ix_transactions_from_account_id", table_name="transactions")
+    op.drop_index("ix_transactions_to_account_id", table_name="transactions")
+
+
+def downgrade() -> None:
+    op.create_index("ix_transactions_to_account_id", "transactions", ["to_account_id"])
+    op.create_index("ix_transactions_from_account_id", "transactions", ["from_account_id"])
+    op.drop_index("ix_tx_to_created", table_name="transactions")
+    op.drop_index("ix_tx_from_created", table_name="transactions")
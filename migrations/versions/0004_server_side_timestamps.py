@@ -0,0 +1,36 @@
+"""Server-side defaults for created_at / updated_at
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-15 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0004"
+down_revision: Union[str, None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+UTC_NOW = sa.text("timezone('utc', now())")
+
+TIMESTAMP_COLUMNS = [
+    ("accounts", "created_at"),
+    ("accounts", "updated_at"),
+    ("payment_methods", "created_at"),
+    ("transactions", "created_at"),
+]
+
+
+def upgrade() -> None:
+    for table, column in TIMESTAMP_COLUMNS:
+        op.alter_column(table, column, server_default=UTC_NOW)
+
+
+def downgrade() -> None:
+    for table, column in TIMESTAMP_COLUMNS:
+        op.alter_column(table, column, server_default=None)
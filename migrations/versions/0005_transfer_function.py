@@ -0,0 +1,71 @@
+"""transfer() stored function: debit, credit and log a transfer in one call
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-15 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0005"
+down_revision: Union[str, None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Locks both accounts, checks the balance, moves the money and writes the transaction
+# row in one call. Returns the new transaction id; an insufficient balance is recorded
+# as a "Failed" row rather than raised, and missing accounts raise SQLSTATE P0002.
+TRANSFER_FUNCTION_SQL = """
+CREATE OR REPLACE FUNCTION transfer(f uuid, t uuid, amt numeric, descr text)
+RETURNS uuid AS $$
+DECLARE
+    acct record;
+    from_balance numeric;
+    locked integer := 0;
+    tx_id uuid := gen_random_uuid();
+BEGIN
+    -- Lock both accounts in id order so concurrent A->B / B->A transfers cannot deadlock
+    FOR acct IN SELECT id, balance FROM accounts WHERE id IN (f, t) ORDER BY id FOR UPDATE LOOP
+        IF acct.id = f THEN
+            from_balance := acct.balance;
+        END IF;
+        locked := locked + 1;
+    END LOOP;
+
+    IF from_balance IS NULL THEN
+        RAISE EXCEPTION 'SOURCE_ACCOUNT_NOT_FOUND' USING ERRCODE = 'P0002';
+    END IF;
+    IF locked < 2 THEN
+        RAISE EXCEPTION 'DESTINATION_ACCOUNT_NOT_FOUND' USING ERRCODE = 'P0002';
+    END IF;
+
+    -- Insufficient funds: record the attempt and hand back its id (raising would roll the record back)
+    IF from_balance < amt THEN
+        INSERT INTO transactions (id, from_account_id, to_account_id, amount, description, status, completed_at)
+        VALUES (tx_id, f, t, amt, descr, 'Failed', timezone('utc', now()));
+        RETURN tx_id;
+    END IF;
+
+    UPDATE accounts
+    SET balance = CASE WHEN id = f THEN balance - amt ELSE balance + amt END,
+        version = version + 1,
+        updated_at = timezone('utc', now())
+    WHERE id IN (f, t);
+
+    INSERT INTO transactions (id, from_account_id, to_account_id, amount, description, status, completed_at)
+    VALUES (tx_id, f, t, amt, descr, 'Completed', timezone('utc', now()));
+    RETURN tx_id;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+
+def upgrade() -> None:
+    op.execute(TRANSFER_FUNCTION_SQL)
+
+
+def downgrade() -> None:
+    op.execute("DROP FUNCTION IF EXISTS transfer(uuid, uuid, numeric, text)")
@@ -0,0 +1,42 @@
+"""Partial indexes on active payment methods, case-insensitive unique email
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-15 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0006"
+down_revision: Union[str, None] = "0005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The unique index cannot be built while emails collide case-insensitively; name them
+    # so they can be merged or renamed by hand before re-running the upgrade
+    duplicates = op.get_bind().execute(sa.text(
+        "SELECT lower(email), array_agg(email ORDER BY created_at) FROM accounts "
+        "GROUP BY lower(email) HAVING count(*) > 1"
+    )).all()
+    if duplicates:
+        listing = "; ".join(f"{key}: {', '.join(emails)}" for key, emails in duplicates)
+        raise RuntimeError(
+            "Cannot create ix_accounts_email_lower: accounts share an email ignoring case "
+            f"({listing}). Merge or rename these accounts, then run `alembic upgrade head` again."
+        )
+
+    op.execute("CREATE INDEX ix_pm_token_active ON payment_methods (token_id) WHERE is_active")
+    op.execute("CREATE INDEX ix_pm_account_active ON payment_methods (account_id) WHERE is_active")
+    op.execute("CREATE UNIQUE INDEX ix_accounts_email_lower ON accounts (lower(email))")
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_accounts_email_lower")
+    op.execute("DROP INDEX IF EXISTS ix_pm_account_active")
+    op.execute("DROP INDEX IF EXISTS ix_pm_token_active")
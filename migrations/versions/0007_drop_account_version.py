@@ -0,0 +1,82 @@
+"""Drop accounts.version; transfer() no longer bumps it
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-15 00:00:00
+
+"""
+import importlib.util
+from pathlib import Path
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0007"
+down_revision: Union[str, None] = "0006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Same as revision 0005 minus the version bump: row-level locks inside transfer() already
+# serialize balance updates, and nothing reads the column since optimistic retries went away
+TRANSFER_FUNCTION_SQL = """
+CREATE OR REPLACE FUNCTION transfer(f uuid, t uuid, amt numeric, descr text)
+RETURNS uuid AS $$
+DECLARE
+    acct record;
+    from_balance numeric;
+    locked integer := 0;
+    tx_id uuid := gen_random_uuid();
+BEGIN
+    -- Lock both accounts in id order so concurrent A->B / B->A transfers cannot deadlock
+    FOR acct IN SELECT id, balance FROM accounts WHERE id IN (f, t) ORDER BY id FOR UPDATE LOOP
+        IF acct.id = f THEN
+            from_balance := acct.balance;
+        END IF;
+        locked := locked + 1;
+    END LOOP;
+
+    IF from_balance IS NULL THEN
+        RAISE EXCEPTION 'SOURCE_ACCOUNT_NOT_FOUND' USING ERRCODE = 'P0002';
+    END IF;
+    IF locked < 2 THEN
+        RAISE EXCEPTION 'DESTINATION_ACCOUNT_NOT_FOUND' USING ERRCODE = 'P0002';
+    END IF;
+
+    -- Insufficient funds: record the attempt and hand back its id (raising would roll the record back)
+    IF from_balance < amt THEN
+        INSERT INTO transactions (id, from_account_id, to_account_id, amount, description, status, completed_at)
+        VALUES (tx_id, f, t, amt, descr, 'Failed', timezone('utc', now()));
+        RETURN tx_id;
+    END IF;
+
+    UPDATE accounts
+    SET balance = CASE WHEN id = f THEN balance - amt ELSE balance + amt END,
+        updated_at = timezone('utc', now())
+    WHERE id IN (f, t);
+
+    INSERT INTO transactions (id, from_account_id, to_account_id, amount, description, status, completed_at)
+    VALUES (tx_id, f, t, amt, descr, 'Completed', timezone('utc', now()));
+    RETURN tx_id;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+
+def _previous_transfer_function_sql() -> str:
+    path = Path(__file__).with_name("0005_transfer_function.py")
+    spec = importlib.util.spec_from_file_location("transfer_function_0005", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.TRANSFER_FUNCTION_SQL
+
+
+def upgrade() -> None:
+    op.execute(TRANSFER_FUNCTION_SQL)
+    op.drop_column("accounts", "version")
+
+
+def downgrade() -> None:
+    op.add_column("accounts", sa.Column("version", sa.Integer(), nullable=False, server_default="0"))
+    op.execute(_previous_transfer_function_sql())
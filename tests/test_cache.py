@@ -0,0 +1,127 @@
+"""
+Tests for the Redis response cache: keys written by @cache must be the ones invalidate() deletes.
+Runs the real account endpoints against an in-memory cache backend and a fake database session.
+"""
+import asyncio
+import uuid
+from datetime import datetime
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+from fastapi_cache import FastAPICache
+from fastapi_cache.backends.inmemory import InMemoryBackend
+
+from app.api import accounts_router
+from app.api.accounts import ensure_account_exists
+from app.core.cache import CACHE_PREFIX
+from app.core.database import get_db
+
+
+class FakeResult:
+    def __init__(self, value):
+        self._value = value
+
+    def scalar_one_or_none(self):
+        return self._value
+
+    def scalar(self):
+        return self._value
+
+
+class FakeSession:
+    """Minimal AsyncSession stand-in serving accounts from a dict keyed by id."""
+
+    def __init__(self, accounts):
+        self.accounts = accounts
+
+    async def execute(self, statement, params=None):
+        return FakeResult(self.accounts.get((params or {}).get("aid")))
+
+    async def commit(self):
+        pass
+
+    async def rollback(self):
+        pass
+
+
+@pytest.fixture
+def account():
+    now = datetime(2026, 1, 1)
+    return SimpleNamespace(
+        id=uuid.uuid4(),
+        name="Shopping AI Agent",
+        email="agent@example.com",
+        balance=Decimal("1000.00"),
+        is_agent=True,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+@pytest.fixture
+def client(account):
+    FastAPICache.init(InMemoryBackend(), prefix=CACHE_PREFIX)
+    session = FakeSession({account.id: account})
+
+    async def override_get_db():
+        yield session
+
+    app = FastAPI()
+    app.include_router(accounts_router)
+    app.dependency_overrides[get_db] = override_get_db
+    return TestClient(app)
+
+
+def test_account_update_invalidates_cached_read(client, account):
+    # Read: populates the cache
+    response = client.get(f"/accounts/{account.id}")
+    assert response.status_code == 200
+    assert response.json()["name"] == "Shopping AI Agent"
+
+    # Write: PATCH commits and must drop the cached entry
+    response = client.patch(f"/accounts/{account.id}", json={"name": "Travel AI Agent"})
+    assert response.status_code == 200
+
+    # Read again: served fresh, not the stale cached name
+    response = client.get(f"/accounts/{account.id}")
+    assert response.status_code == 200
+    assert response.json()["name"] == "Travel AI Agent"
+
+
+class FailingBackend(InMemoryBackend):
+    """Cache backend that behaves like an unreachable Redis."""
+
+    async def get(self, key):
+        raise ConnectionError("redis down")
+
+    async def get_with_ttl(self, key):
+        raise ConnectionError("redis down")
+
+    async def set(self, key, value, expire=None):
+        raise ConnectionError("redis down")
+
+    async def clear(self, namespace=None, key=None):
+        raise ConnectionError("redis down")
+
+
+def test_cache_outage_does_not_fail_committed_write(client, account):
+    FastAPICache.init(FailingBackend(), prefix=CACHE_PREFIX)
+
+    response = client.patch(f"/accounts/{account.id}", json={"name": "Travel AI Agent"})
+    assert response.status_code == 200
+    assert response.json()["name"] == "Travel AI Agent"
+
+
+def test_cache_outage_falls_back_to_database_for_existence_check(account):
+    FastAPICache.init(FailingBackend(), prefix=CACHE_PREFIX)
+    session = FakeSession({account.id: account})
+
+    # Redis is down: the check must still answer from the database instead of raising
+    asyncio.run(ensure_account_exists(account.id, session))
+
+    with pytest.raises(HTTPException) as excinfo:
+        asyncio.run(ensure_account_exists(uuid.uuid4(), session))
+    assert excinfo.value.status_code == 404